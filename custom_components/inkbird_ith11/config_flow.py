@@ -15,7 +15,12 @@ from .const import DOMAIN, CONF_MAC, CONF_NAME, DEFAULT_NAME
 
 _LOGGER = logging.getLogger(__name__)
 
-MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
+MAC_RE = re.compile(r"([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})")
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_MAC): str,
+    vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
+})
 
 
 class InkbirdConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -30,7 +35,7 @@ class InkbirdConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if user_input is not None:
                 mac = user_input.get(CONF_MAC, "").strip()
                 name = user_input.get(CONF_NAME) or DEFAULT_NAME
-                if not MAC_RE.match(mac):
+                if not MAC_RE.fullmatch(mac):
                     errors["base"] = "invalid_mac"
                 else:
                     # Use MAC as unique ID
@@ -38,14 +43,9 @@ class InkbirdConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     self._abort_if_unique_id_configured()
                     return self.async_create_entry(title=name, data={CONF_MAC: mac.lower(), CONF_NAME: name})
 
-            data_schema = vol.Schema({
-                vol.Required(CONF_MAC): str,
-                vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
-            })
-
             return self.async_show_form(
                 step_id="user",
-                data_schema=data_schema,
+                data_schema=_USER_SCHEMA,
                 errors=errors,
             )
         except Exception:  # pragma: no cover - log and re-raise so HA surfaces the error
@@ -64,12 +64,13 @@ class InkbirdOptionsFlow(config_entries.OptionsFlow):
 
     def __init__(self, config_entry):
         self.config_entry = config_entry
+        # The default depends on the entry, so build the schema once per flow
+        self._schema = vol.Schema({
+            vol.Optional(CONF_NAME, default=config_entry.data.get(CONF_NAME)): str,
+        })
 
     async def async_step_init(self, user_input=None):  # type: ignore[override]
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        data_schema = vol.Schema({
-            vol.Optional(CONF_NAME, default=self.config_entry.data.get(CONF_NAME)): str,
-        })
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+        return self.async_show_form(step_id="init", data_schema=self._schema)
@@ -5,47 +5,54 @@ bytes to extract temperature (°C), humidity (%), and battery (%).
 
 The ITH-11-B advertising format varies by firmware; this parser scans
 manufacturer_data and service_data byte payloads for plausible numeric
-patterns (int16 temperature with scale 0.01 or 0.1, humidity as 0-100,
+patterns (int16 temperature with scale 0.01, humidity as 0-100,
 battery as 0-100). It returns a dict with available keys: 'temperature',
 'humidity', 'battery'.
 """
 from __future__ import annotations
 
+import struct
 from typing import Optional, Tuple
 
+# Candidate int16 layouts for the temperature search, in the order they are tried.
+_TEMP_STRUCTS = (
+    struct.Struct("<h"),
+    struct.Struct("<H"),
+    struct.Struct(">h"),
+    struct.Struct(">H"),
+)
 
-def _as_bytes(value) -> bytes:
-    if value is None:
-        return b""
-    if isinstance(value, bytes):
-        return value
-    if isinstance(value, bytearray):
-        return bytes(value)
-    # Some HA objects might expose memoryview
-    try:
-        return bytes(value)
-    except Exception:
-        return b""
+# ITH-11-B manufacturer payload (company id 9545) from offset 4:
+# temperature (u16 LE, 0.1 °C), humidity (u16 LE, 0.1 %), battery (u8, %)
+_ITH_STRUCT = struct.Struct("<HHB")
+
+# bytes.translate tables so the humidity/battery scans run in C:
+# humidity candidates (3 < b <= 100) map to 1; battery bytes map to
+# 2 for 10..100 and 1 for the 0..9 last-resort values.
+_HUM_TABLE = bytes(1 if 3 < i <= 100 else 0 for i in range(256))
+_BATT_TABLE = bytes(2 if 10 <= i <= 100 else 1 if i < 10 else 0 for i in range(256))
 
 
 def _find_temperature(payload: bytes) -> Tuple[Optional[float], Optional[int]]:
     """Search payload for a plausible temperature value and return (temp, index).
 
-    Tries signed/unsigned 16-bit values interpreted as x/100 or x/10.
+    Tries signed/unsigned 16-bit values interpreted as x/100.
     Returns (temperature in °C, index) if found in realistic range (-40..85).
     """
     if not payload:
         return None, None
+    # unpack_from reads any buffer in place; only non-buffer input needs converting
+    if not isinstance(payload, (bytes, bytearray, memoryview)):
+        payload = bytes(payload)
 
     for i in range(len(payload) - 1):
-        # try combinations of endian/signed/scale
-        for byteorder in ("little", "big"):
-            for signed in (True, False):
-                raw = int.from_bytes(payload[i:i+2], byteorder=byteorder, signed=signed)
-                for scale in (100.0, 10.0):
-                    temp = raw / scale
-                    if -40.0 <= temp <= 85.0:
-                        return round(temp, 2), i
+        # try combinations of endian/signed (range checked on the raw int).
+        # Only x/100 is tried: any raw value plausible as x/10 (-400..850) is
+        # also plausible as x/100, so an x/10 reading could never be chosen.
+        for st in _TEMP_STRUCTS:
+            raw = st.unpack_from(payload, i)[0]
+            if -4000 <= raw <= 8500:
+                return round(raw / 100.0, 2), i
     return None, None
 
 
@@ -57,22 +64,25 @@ def _find_humidity(payload: bytes, temp_index: Optional[int] = None) -> Tuple[Op
     """
     if not payload:
         return None, None
+    if not isinstance(payload, (bytes, bytearray)):
+        payload = bytes(payload)
 
-    candidates = [(idx, b) for idx, b in enumerate(payload) if 0 <= b <= 100 and b > 3]
-    if not candidates:
-        return None, None
-
+    mask = payload.translate(_HUM_TABLE)
     if temp_index is not None:
-        after = [c for c in candidates if c[0] > temp_index]
-        if after:
-            # choose the closest one after temp_index
-            chosen = min(after, key=lambda t: t[0])
-            return int(chosen[1]), int(chosen[0])
+        # choose the closest one after temp_index
+        idx = mask.find(b"\x01", max(temp_index + 1, 0))
+        if idx >= 0:
+            return payload[idx], idx
 
-    # fallback: prefer candidates in the middle/end region
+    # fallback: the candidate closest to the middle, lower index on ties
     mid = len(payload) // 2
-    chosen = min(candidates, key=lambda t: abs(t[0] - mid))
-    return int(chosen[1]), int(chosen[0])
+    left = mask.rfind(b"\x01", 0, mid + 1)
+    right = mask.find(b"\x01", mid + 1)
+    if left < 0 and right < 0:
+        return None, None
+    if right < 0 or (left >= 0 and mid - left <= right - mid):
+        return payload[left], left
+    return payload[right], right
 
 
 def _find_battery(payload: bytes, temp_index: Optional[int] = None, hum_index: Optional[int] = None) -> Tuple[Optional[int], Optional[int]]:
@@ -82,18 +92,18 @@ def _find_battery(payload: bytes, temp_index: Optional[int] = None, hum_index: O
     """
     if not payload:
         return None, None
+    if not isinstance(payload, (bytes, bytearray)):
+        payload = bytes(payload)
 
-    for idx in range(len(payload) - 1, -1, -1):
-        b = payload[idx]
-        if 10 <= b <= 100:
-            return int(b), idx
-
-    # last-resort: any 0..100 value
-    for idx, b in enumerate(payload):
-        if 0 <= b <= 100:
-            return int(b), idx
-
-    return None, None
+    # scan from the end for a reasonable battery (>=10%)
+    mask = payload.translate(_BATT_TABLE)
+    idx = mask.rfind(b"\x02")
+    if idx < 0:
+        # last-resort: any 0..100 value
+        idx = mask.find(b"\x01")
+        if idx < 0:
+            return None, None
+    return payload[idx], idx
 
 
 def parse(service_info) -> dict:
@@ -101,37 +111,39 @@ def parse(service_info) -> dict:
 
     This parser is strict: it decodes only Inkbird ITH-11-B manufacturer_data
     under company id 9545 using the documented offsets. If that key is not
-    present or the payload is too short, the function returns an empty dict.
+    present, the payload is too short, or it is not a byte sequence (bytes,
+    bytearray, memoryview, or a list/tuple of 0..255 ints), the function
+    returns an empty dict.
     """
-    result = {}
-
-    try:
-        mfg = getattr(service_info, "manufacturer_data", None)
-        if isinstance(mfg, dict) and 9545 in mfg:
-            payload = _as_bytes(mfg.get(9545))
-            # Need at least 9 bytes for indexes up to x[8]
-            if payload and len(payload) > 8:
-                # user-provided formulas:
-                # humidity = (x[7] << 8) + x[6]
-                # temperature = (x[5] << 8) + x[4]
-                # battery = x[8]
-                try:
-                    raw_hum = (payload[7] << 8) + payload[6]
-                    raw_temp = (payload[5] << 8) + payload[4]
-                    batt = payload[8]
-
-                    # Scale: device uses 0.1 units (e.g., 161 -> 16.1°C, 999 -> 99.9%)
-                    hum = round(raw_hum / 10.0, 1)
-                    temp = round(raw_temp / 10.0, 1)
-
-                    result["temperature"] = temp
-                    result["humidity"] = hum
-                    result["battery"] = int(batt)
-                    return result
-                except Exception:
-                    # If decoding fails, return empty rather than guessing
-                    return {}
-    except Exception:
+    mfg = getattr(service_info, "manufacturer_data", None)
+    if not mfg or not isinstance(mfg, dict):
+        return {}
+
+    payload = mfg.get(9545)
+    if payload is None:
+        return {}
+    # bytes/bytearray/memoryview all support unpack_from without a copy
+    if isinstance(payload, (list, tuple)):
+        try:
+            payload = bytes(payload)
+        except (TypeError, ValueError):
+            return {}
+    elif not isinstance(payload, (bytes, bytearray, memoryview)):
+        return {}
+    # Need at least 9 bytes for indexes up to x[8]
+    if len(payload) < 9:
         return {}
 
-    return {}
+    # user-provided formulas:
+    # humidity = (x[7] << 8) + x[6]
+    # temperature = (x[5] << 8) + x[4]
+    # battery = x[8]
+    raw_temp, raw_hum, batt = _ITH_STRUCT.unpack_from(payload, 4)
+
+    # Scale: device uses 0.1 units (e.g., 161 -> 16.1°C, 999 -> 99.9%).
+    # A single int / 10.0 is already the nearest float, so no round() needed.
+    return {
+        "temperature": raw_temp / 10.0,
+        "humidity": raw_hum / 10.0,
+        "battery": batt,
+    }
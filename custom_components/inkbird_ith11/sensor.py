@@ -2,15 +2,15 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers import entity
-from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 
 from homeassistant.components.bluetooth import (
     async_register_callback,
@@ -25,18 +25,24 @@ from .parser import parse
 
 _LOGGER = logging.getLogger(__name__)
 
-UPDATE_SIGNAL = f"{DOMAIN}_update"
-
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up sensors for a config entry."""
     entry_id = entry.entry_id
     mac = entry.data.get(CONF_MAC)
+    if not mac:
+        _LOGGER.error("Inkbird entry %s has no MAC address; cannot listen for BLE adverts", entry_id)
+        return
     name = entry.data.get("name") or mac
+    # HA reports BLE addresses as AA:BB:CC:DD:EE:FF; entries store the MAC
+    # lower-case and possibly dash-separated
+    address = mac.upper().replace("-", ":")
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault(entry_id, {})
     hass.data[DOMAIN][entry_id]["state"] = {}
+    # Bound once so the advert callback avoids the nested hass.data lookups
+    state = hass.data[DOMAIN][entry_id]["state"]
 
     # Create entities
     sensors = [
@@ -52,95 +58,72 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddE
         @callback
         def _service_info_callback(service_info, change=None) -> None:
             try:
-                # Some BLE proxies change the source address; don't strictly filter by address here.
-                # Do not bail out if `address` is None — ESPHome BLE proxy may forward adverts without an address.
-                # Log received advertisement for debugging
-                try:
-                    mfg = getattr(service_info, "manufacturer_data", None)
-                    sdata = getattr(service_info, "service_data", None)
-                except Exception:
-                    mfg = None
-                    sdata = None
-                _LOGGER.debug("Inkbird received advert from %s, manufacturer_data=%s, service_data=%s", service_info.address, mfg, sdata)
+                # Cheap company-id gate first so unrelated adverts cost nothing
+                mfg = getattr(service_info, "manufacturer_data", None)
+                if not mfg or 9545 not in mfg:
+                    return
 
                 data = parse(service_info)
                 if not data:
                     return
 
-                # Build raw payload hex map for attributes
-                raw_mfg = {}
-                raw_svc = {}
-                try:
-                    if isinstance(mfg, dict):
-                        for k, v in mfg.items():
-                            try:
-                                raw_mfg[str(k)] = bytes(v).hex()
-                            except Exception:
+                # Debug logging and raw payload hex maps only when DEBUG is on
+                raw_mfg = None
+                raw_svc = None
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    sdata = getattr(service_info, "service_data", None)
+                    _LOGGER.debug("Inkbird received advert from %s, manufacturer_data=%s, service_data=%s", service_info.address, mfg, sdata)
+                    raw_mfg = {}
+                    raw_svc = {}
+                    try:
+                        if isinstance(mfg, dict):
+                            for k, v in mfg.items():
                                 try:
-                                    raw_mfg[str(k)] = v.hex()
+                                    raw_mfg[str(k)] = bytes(v).hex()
                                 except Exception:
-                                    raw_mfg[str(k)] = str(v)
-                    if isinstance(sdata, dict):
-                        for k, v in sdata.items():
-                            try:
-                                raw_svc[str(k)] = bytes(v).hex()
-                            except Exception:
+                                    try:
+                                        raw_mfg[str(k)] = v.hex()
+                                    except Exception:
+                                        raw_mfg[str(k)] = str(v)
+                        if isinstance(sdata, dict):
+                            for k, v in sdata.items():
                                 try:
-                                    raw_svc[str(k)] = v.hex()
+                                    raw_svc[str(k)] = bytes(v).hex()
                                 except Exception:
-                                    raw_svc[str(k)] = str(v)
-                except Exception:
-                    pass
-
-                # Add last_seen timestamp
-                ts = datetime.utcnow().isoformat() + "Z"
+                                    try:
+                                        raw_svc[str(k)] = v.hex()
+                                    except Exception:
+                                        raw_svc[str(k)] = str(v)
+                    except Exception:
+                        pass
 
                 # Update state with parsed values and debug attributes
-                hass.data[DOMAIN][entry_id]["state"].update(data)
-                hass.data[DOMAIN][entry_id]["state"]["raw_manufacturer"] = raw_mfg
-                hass.data[DOMAIN][entry_id]["state"]["raw_service_data"] = raw_svc
-                hass.data[DOMAIN][entry_id]["state"]["last_seen"] = ts
+                state.update(data)
+                if raw_mfg is not None:
+                    state["raw_manufacturer"] = raw_mfg
+                    state["raw_service_data"] = raw_svc
+                else:
+                    # Don't keep showing a stale dump once DEBUG is turned off
+                    state.pop("raw_manufacturer", None)
+                    state.pop("raw_service_data", None)
+                # Raw epoch seconds; formatted lazily in extra_state_attributes
+                state["last_seen_ts"] = time.time()
 
                 _LOGGER.debug("Inkbird parsed data for %s: %s (raw_mfg=%s, raw_svc=%s)", service_info.address, data, raw_mfg, raw_svc)
-                # Send the full state (including raw payloads) to listeners
-                full_state = hass.data[DOMAIN][entry_id]["state"].copy()
-                async_dispatcher_send(hass, f"{UPDATE_SIGNAL}_{entry_id}", full_state)
+                # Push straight to our own entities; attributes are read from
+                # hass.data in extra_state_attributes.
+                for sensor in sensors:
+                    sensor._apply_parsed(data)
             except Exception as exc:  # pragma: no cover - robust handling
                 _LOGGER.exception("Error parsing Inkbird service info: %s", exc)
 
-        # Use BluetoothScanningMode as required by modern HA API
-        matcher = BluetoothCallbackMatcher(address=mac)
-        unregister = async_register_callback(hass, _service_info_callback, matcher, BluetoothScanningMode.ACTIVE)
+        # One callback bound to this device's address; parse() rejects anything that
+        # is not a 9545 payload. The sensor only broadcasts, so PASSIVE scanning is
+        # enough.
+        matcher = BluetoothCallbackMatcher(address=address)
+        unregister = async_register_callback(hass, _service_info_callback, matcher, BluetoothScanningMode.PASSIVE)
         unregisters = [unregister]
-        _LOGGER.debug("Registered bluetooth callback for address matcher (mac=%s).", mac)
-
-        # Also register fallback matchers to increase chance of receiving adverts
-        try:
-            mfg_matcher = BluetoothCallbackMatcher(manufacturer_id=9545)
-            un2 = async_register_callback(hass, _service_info_callback, mfg_matcher, BluetoothScanningMode.ACTIVE)
-            unregisters.append(un2)
-            _LOGGER.debug("Registered bluetooth callback for manufacturer_id=9545")
-        except Exception:
-            _LOGGER.debug("Could not register manufacturer_id matcher")
-
-        try:
-            uuid_matcher = BluetoothCallbackMatcher(service_uuid="0000fff0-0000-1000-8000-00805f9b34fb")
-            un3 = async_register_callback(hass, _service_info_callback, uuid_matcher, BluetoothScanningMode.ACTIVE)
-            unregisters.append(un3)
-            _LOGGER.debug("Registered bluetooth callback for service_uuid fff0")
-        except Exception:
-            _LOGGER.debug("Could not register service_uuid matcher")
-
-        # DEBUG fallback: register a global matcher that receives all adverts so we can
-        # verify the callback is fired even if specific matchers fail (remove in prod).
-        try:
-            global_matcher = BluetoothCallbackMatcher()
-            un_global = async_register_callback(hass, _service_info_callback, global_matcher, BluetoothScanningMode.ACTIVE)
-            unregisters.append(un_global)
-            _LOGGER.debug("Registered global bluetooth callback matcher for debugging")
-        except Exception:
-            _LOGGER.debug("Could not register global matcher")
-        _LOGGER.debug("Total bluetooth callbacks registered: %d", len(unregisters))
+        _LOGGER.debug("Registered bluetooth callback for address matcher (address=%s)", address)
     except Exception:  # pragma: no cover - best effort
         _LOGGER.error("Bluetooth integration not available; cannot listen for Inkbird BLE adverts")
         return
@@ -172,6 +155,8 @@ class InkbirdSensor(SensorEntity):
         self._unique_id = f"{entry_id}_{sensor_type}"
         self._attr_name = f"{base_name} {sensor_type.capitalize()}"
         self._state = None
+        # True only between async_added_to_hass and async_will_remove_from_hass
+        self._added = False
 
         if sensor_type == SENSOR_TEMPERATURE:
             self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -200,8 +185,9 @@ class InkbirdSensor(SensorEntity):
             attrs["raw_manufacturer"] = state.get("raw_manufacturer")
         if "raw_service_data" in state:
             attrs["raw_service_data"] = state.get("raw_service_data")
-        if "last_seen" in state:
-            attrs["last_seen"] = state.get("last_seen")
+        ts = state.get("last_seen_ts")
+        if ts is not None:
+            attrs["last_seen"] = datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
         return attrs
 
     @property
@@ -221,6 +207,7 @@ class InkbirdSensor(SensorEntity):
         }
 
     async def async_added_to_hass(self) -> None:
+        self._added = True
         # Initialize from stored state if available
         state = self.hass.data[DOMAIN][self._entry_id].get("state", {})
         if self._sensor_type in state:
@@ -228,17 +215,18 @@ class InkbirdSensor(SensorEntity):
             # Ensure HA sees the initial value immediately
             self.async_write_ha_state()
 
-        # Subscribe to updates
-        self._unsub = async_dispatcher_connect(
-            self.hass, f"{UPDATE_SIGNAL}_{self._entry_id}", self._handle_update
-        )
-
     async def async_will_remove_from_hass(self) -> None:
-        if hasattr(self, "_unsub") and callable(self._unsub):
-            self._unsub()
+        # The advert callback lives as long as the entry, so stop writing state here
+        self._added = False
 
     @callback
-    def _handle_update(self, data: dict) -> None:
-        if self._sensor_type in data:
-            self._state = data[self._sensor_type]
+    def _apply_parsed(self, data: dict) -> None:
+        """Apply freshly parsed values.
+
+        State is written on every advert, even when our value is unchanged,
+        so the last_seen attribute keeps tracking the device.
+        """
+        self._state = data.get(self._sensor_type, self._state)
+        # Before being added the value is picked up in async_added_to_hass
+        if self._added:
             self.async_write_ha_state()
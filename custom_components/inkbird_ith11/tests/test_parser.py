@@ -37,3 +37,65 @@ def test_no_values():
     res = parser.parse(svc)
     assert res == {}
 
+
+# 02 28 07 5C A1 00 E7 03 46 00 44 08 00 00 00 00 -> 16.1°C, 99.9%, 70%
+ITH_SAMPLE_1 = bytes([0x02, 0x28, 0x07, 0x5C, 0xA1, 0x00, 0xE7, 0x03, 0x46, 0x00, 0x44, 0x08, 0x00, 0x00, 0x00, 0x00])
+# 02 28 07 5C 9F 00 E7 03 56 00 44 08 00 00 00 00 -> 15.9°C, 99.9%, 86%
+ITH_SAMPLE_2 = bytes([0x02, 0x28, 0x07, 0x5C, 0x9F, 0x00, 0xE7, 0x03, 0x56, 0x00, 0x44, 0x08, 0x00, 0x00, 0x00, 0x00])
+
+
+def test_parse_9545_samples():
+    res = parser.parse(DummyServiceInfo(manufacturer_data={9545: ITH_SAMPLE_1}))
+    assert res == {'temperature': 16.1, 'humidity': 99.9, 'battery': 70}
+    res = parser.parse(DummyServiceInfo(manufacturer_data={9545: ITH_SAMPLE_2}))
+    assert res == {'temperature': 15.9, 'humidity': 99.9, 'battery': 86}
+
+
+def test_parse_9545_short_payload():
+    svc = DummyServiceInfo(manufacturer_data={9545: ITH_SAMPLE_1[:8]})
+    assert parser.parse(svc) == {}
+
+
+def test_parse_9545_buffer_types():
+    expected = {'temperature': 16.1, 'humidity': 99.9, 'battery': 70}
+    for payload in (bytearray(ITH_SAMPLE_1), memoryview(ITH_SAMPLE_1), list(ITH_SAMPLE_1)):
+        svc = DummyServiceInfo(manufacturer_data={9545: payload})
+        assert parser.parse(svc) == expected
+
+
+def test_parse_9545_non_bytes_payload():
+    for payload in ("0228075ca100e7034600", [0x02, 0x28, 0x07, 0x5C, 0xA1, 0x00, 0xE7, 0x03, 300], 12345):
+        svc = DummyServiceInfo(manufacturer_data={9545: payload})
+        assert parser.parse(svc) == {}
+
+
+def test_find_temperature_scan_order():
+    # little-endian is tried before big-endian: LE 1 -> 0.01 beats BE 256 -> 2.56
+    assert parser._find_temperature(b'\x01\x00') == (0.01, 0)
+    # signed little-endian: 0xFC18 -> -1000 -> -10.0
+    assert parser._find_temperature(b'\x18\xfc') == (-10.0, 0)
+    # LE 0xE600 is out of range either way, BE 230 is taken as x/100
+    assert parser._find_temperature(b'\x00\xe6') == (2.3, 0)
+    # the first index with any plausible value wins
+    assert parser._find_temperature(b'\x80\x80\x29\x09') == (23.45, 2)
+    assert parser._find_temperature(b'\xff') == (None, None)
+
+
+def test_find_humidity_tie_and_temp_index():
+    payload = bytes([0, 50, 0, 60, 0])
+    # both candidates are one away from mid (2): the lower index wins
+    assert parser._find_humidity(payload) == (50, 1)
+    # first candidate after temp_index
+    assert parser._find_humidity(payload, temp_index=1) == (60, 3)
+    # temp_index past the end falls back to the closest-to-mid candidate
+    assert parser._find_humidity(payload, temp_index=10) == (50, 1)
+    assert parser._find_humidity(bytes([0, 2, 200])) == (None, None)
+
+
+def test_find_battery():
+    # last >=10% byte from the end
+    assert parser._find_battery(bytes([50, 200, 80, 5])) == (80, 2)
+    # only 0..9 values: first one from the start
+    assert parser._find_battery(bytes([200, 5, 7, 150])) == (5, 1)
+    # nothing <= 100
+    assert parser._find_battery(bytes([200, 255])) == (None, None)